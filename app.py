@@ -1,13 +1,24 @@
 import streamlit as st
 from pdf_repair_service import PDFRepairService
 import logging
-import time
+import os
+import shutil
+import tempfile
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource
+def get_service() -> PDFRepairService:
+    """
+    Create the PDF repair service once and reuse it across reruns and sessions, keeping its HTTP connections,
+    OCR workers and caches alive.
+    """
+    return PDFRepairService()
+
+
 def main():
     # Set page configuration for full-screen width
     st.set_page_config(page_title="Chinese PDF OCR and Error Correction PoC", layout="wide")
@@ -16,48 +27,70 @@ def main():
 
     # Initialize the PDF repair service
     try:
-        repair_service = PDFRepairService()
+        repair_service = get_service()
         logger.info("PDFRepairService initialized successfully.")
     except Exception as e:
         st.error(f"Failed to initialize the service: {e}")
         return
 
+    # Chunks can be corrected with context from the end of the previous chunk (sequential) or independently (concurrent)
+    use_context = st.sidebar.checkbox("Use previous-chunk context", value=True)
+    # The batch API only applies to independent chunks, and needs its own API key
+    batch_configured = repair_service.batch_api_configured()
+    use_batch = st.sidebar.checkbox(
+        "Use batch API (slower, cheaper)",
+        value=False,
+        disabled=use_context or not batch_configured,
+        help=None if batch_configured else "Set BATCH_API_KEY in .env to enable the batch API.",
+    )
+
+    # Higher resolutions help with messy scans at the cost of slower OCR
+    dpi = st.sidebar.slider("OCR resolution (DPI)", min_value=100, max_value=400, value=150, step=25)
+
     # File uploader for PDF
     uploaded_file = st.file_uploader("Upload a PDF file", type=["pdf"], key="pdf_uploader")
 
     if uploaded_file is not None:
-        # Save the uploaded file temporarily
-        with open("temp.pdf", "wb") as f:
-            f.write(uploaded_file.getbuffer())
-
-        st.write("Processing the PDF...")
-
-        # Create a progress bar and status container
+        # Create a status container that is updated as each step actually starts, and a progress bar
+        status = st.status("Processing the PDF...", expanded=True)
         progress_bar = st.progress(0)
-        status_container = st.empty()
 
+        pdf_path = None
         try:
-            # Step 1: Extract text using OCR
-            status_container.write("Step 1: Extracting text from PDF using OCR...")
-            extracted_text = repair_service.extract_text_from_pdf("temp.pdf")
+            # Stream the uploaded file to a temporary file in 64 KB chunks instead of materializing it in one write
+            uploaded_file.seek(0)
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False, buffering=64 * 1024) as f:
+                pdf_path = f.name
+                shutil.copyfileobj(uploaded_file, f, length=64 * 1024)
+
+            if use_batch and not use_context and batch_configured:
+                # Step 1: Extract text using OCR
+                status.write("Step 1: Extracting text from PDF using OCR...")
+                extracted_text = repair_service.extract_text_from_pdf(pdf_path, dpi=dpi)
+                progress_bar.progress(20)
+
+                # Step 2: Split and correct text with the batch API
+                status.write("Step 2: Correcting OCR errors with the batch API (this may take a while)...")
+                corrected_chunks = repair_service.run(repair_service.split_and_correct_text_batch(extracted_text))
+            elif use_context:
+                # Steps 1-2: Extract text using OCR, streaming pages into the DeepSeek chains as they are recognized
+                status.write("Steps 1-2: Extracting text using OCR and correcting OCR errors with DeepSeek chains and previous-chunk context...")
+                extracted_text, corrected_chunks = repair_service.run(repair_service.correct_pdf(pdf_path, dpi=dpi))
+            else:
+                # Steps 1-2: Extract text using OCR, streaming pages into concurrent DeepSeek corrections as they are recognized
+                status.write("Steps 1-2: Extracting text using OCR and correcting OCR errors with DeepSeek concurrently...")
+                extracted_text, corrected_chunks = repair_service.run(repair_service.correct_pdf(pdf_path, dpi=dpi, use_context=False))
             original_length = len(extracted_text)
             logger.debug(f"Extracted text length: {original_length}")
-            progress_bar.progress(20)
-            time.sleep(0.5)  # Simulate processing time
+            progress_bar.progress(90)
 
-            # Step 2: Split, correct with chains, and reassemble text
-            status_container.write("Step 2: Correcting OCR errors with DeepSeek chains and summarizing context...")
-            corrected_chunks = repair_service.split_and_correct_text_with_runnables(extracted_text)
+            # Step 3: Reassemble text
+            status.write("Step 3: Reassembling the corrected text...")
             corrected_text = repair_service.reassemble_text(corrected_chunks, original_length)
             logger.debug(f"Number of corrected chunks: {len(corrected_chunks)}")
             logger.debug(f"Final corrected text length: {len(corrected_text)}")
-            progress_bar.progress(90)
-            time.sleep(0.5)  # Simulate processing time
-
-            # Step 3: Finalize and clean up
-            status_container.write("Step 3: Finalizing and cleaning up...")
             progress_bar.progress(100)
-            time.sleep(0.5)  # Simulate processing time
+            status.update(label="PDF processed successfully!", state="complete", expanded=False)
 
             st.success("PDF processed successfully!")
             st.subheader("Text Comparison (Extracted vs. Corrected)")
@@ -74,18 +107,17 @@ def main():
                 st.text_area("Corrected Text", corrected_text, height=300, disabled=True)
 
         except Exception as e:
+            status.update(label="Error processing the PDF", state="error")
             st.error(f"Error processing the PDF: {e}")
             logger.error(f"Error processing PDF: {e}")
-        
-        # Clean up temporary file
-        import os
-        if os.path.exists("temp.pdf"):
-            os.remove("temp.pdf")
-            logger.info("Temporary PDF file removed.")
-
-        # Clear progress and status after processing
-        progress_bar.empty()
-        status_container.empty()
+        finally:
+            # Clean up temporary file, even if processing was interrupted
+            if pdf_path and os.path.exists(pdf_path):
+                os.remove(pdf_path)
+                logger.info("Temporary PDF file removed.")
+
+            # Clear progress after processing
+            progress_bar.empty()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
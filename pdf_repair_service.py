@@ -2,12 +2,29 @@ from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.runnables import RunnableSequence
-from pdf2image import convert_from_path
-import pytesseract
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+import os
+
+# Limit Tesseract's internal OpenMP threads before libtesseract is loaded; parallelism comes from the process pool,
+# which is faster than OpenMP on multi-core machines. An explicit OMP_THREAD_LIMIT in the environment takes precedence.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+import cv2
+import fitz
+import numpy as np
+from tesserocr import OEM, PyTessBaseAPI
+import asyncio
 import logging
 from dotenv import load_dotenv
-import os
-import subprocess
+import diskcache
+import hashlib
+import httpx
+import json
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import threading
 
 # Load environment variables
 load_dotenv()
@@ -17,6 +34,150 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Per-process Tesseract API, created once by the pool initializer and reused for every page
+_tess_api = None
+
+# Rendered pages taller than this at the default 150 DPI are downscaled before OCR. The cap scales with the DPI,
+# so it only trims oversized pages and never undoes a higher DPI chosen for small print
+_MAX_PAGE_HEIGHT = 1800
+
+# Version of the render/preprocess/OCR pipeline in _ocr_page; bump it whenever that pipeline changes,
+# so OCR output cached by an earlier version is not reused
+_OCR_VERSION = 2
+
+
+def _init_ocr_worker(lang) -> None:
+    """
+    Initialize a resident Tesseract API in an OCR worker process, loading the language model once.
+
+    Args:
+        lang (str): Tesseract language code.
+    """
+    global _tess_api
+    # Use the LSTM engine only, skipping the slower legacy engine
+    _tess_api = PyTessBaseAPI(lang=lang, oem=OEM.LSTM_ONLY)
+    _tess_api.SetVariable("preserve_interword_spaces", "1")
+
+
+def _ocr_page(pdf_path, page_number, dpi) -> str:
+    """
+    Render a single PDF page with PyMuPDF, downscale and binarize it, and run OCR on it with the worker's
+    resident Tesseract API. Kept at module level so it can be pickled and dispatched to worker processes.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        page_number (int): Zero-based index of the page to OCR.
+        dpi (int): Resolution at which the page is rendered.
+
+    Returns:
+        str: Raw OCR text for the page.
+    """
+    # Render in-process as 8-bit grayscale and hand the raw pixels straight to Tesseract, with no image files
+    with fitz.open(pdf_path) as doc:
+        pix = doc.load_page(page_number).get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+
+    # Downscale oversized pages and binarize with Otsu, so Tesseract runs over fewer, cleaner pixels
+    h, w = img.shape
+    max_height = _MAX_PAGE_HEIGHT * dpi // 150
+    if h > max_height:
+        img = cv2.resize(img, (int(w * max_height / h), max_height), interpolation=cv2.INTER_AREA)
+        dpi = int(dpi * max_height / h)
+    img = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+
+    h, w = img.shape
+    _tess_api.SetImageBytes(img.tobytes(), w, h, 1, w)
+    _tess_api.SetSourceResolution(dpi)
+    return _tess_api.GetUTF8Text()
+
+
+def _file_digest(path) -> str:
+    """
+    Compute the SHA-256 digest of a file, reading it in chunks.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        str: SHA-256 hex digest of the file contents.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def _aiter(items):
+    """
+    Wrap a list in an async iterator, so already-split text can feed the streaming correction pipeline.
+
+    Args:
+        items (list): Items to yield.
+
+    Yields:
+        Any: Each item, in order.
+    """
+    for item in items:
+        yield item
+
+
+class AdaptiveRateLimiter:
+    """
+    An async concurrency limiter for LLM requests that adapts its limit with AIMD: the limit grows by one
+    after a full window of successful requests and is halved at most once per window when the API signals
+    rate limiting.
+    """
+
+    def __init__(self, initial_limit=8, max_limit=64) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit (int): Number of concurrent requests allowed at start.
+            max_limit (int): Upper bound for the concurrency limit.
+        """
+        self.limit = initial_limit
+        self.max_limit = max_limit
+        self._in_flight = 0
+        self._successes = 0
+        # Responses still expected from the window in which the limit was last decreased
+        self._decrease_cooldown = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+        return False
+
+    def record_success(self) -> None:
+        """
+        Additively increase the limit after a full window of successful requests.
+        """
+        self._decrease_cooldown = max(0, self._decrease_cooldown - 1)
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self.limit = min(self.max_limit, self.limit + 1)
+
+    def record_rate_limited(self) -> None:
+        """
+        Multiplicatively decrease the limit after a rate-limit signal. Signals from requests sent in the same
+        window as the last decrease are ignored, so a burst of 429s halves the limit only once.
+        """
+        if self._decrease_cooldown > 0:
+            self._decrease_cooldown -= 1
+            return
+        self._decrease_cooldown = self.limit
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+        logger.warning(f"Rate limited by the LLM API; reducing concurrency to {self.limit}.")
+
 class PDFRepairService:
     """
     A service class to extract text from Chinese PDFs using OCR, correct OCR errors using DeepSeek
@@ -34,10 +195,21 @@ class PDFRepairService:
             #     model="deepseek-chat",
             #     temperature=0,
             # )
+
+            # Shared HTTP/2 client so all chunk requests multiplex over a pooled connection to OpenRouter
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64),
+                timeout=120,
+                event_hooks={"response": [self._record_rate_limit]},
+            )
             self.llm = ChatOpenAI(
             openai_api_key=os.getenv("OPENROUTER_API_KEY"),
-            openai_api_base='https://openrouter.ai/api/v1',
+            openai_api_base=os.getenv("OPENROUTER_BASE_URL", 'https://openrouter.ai/api/v1'),
             model_name="deepseek/deepseek-r1:free",
+            temperature=0,
+            http_async_client=self.http_client,
+            max_retries=0,  # Retries are handled by _ainvoke_with_retry so they go through the rate limiter
             )
             logger.info("DeepSeek model initialized successfully.")
         except Exception as e:
@@ -47,60 +219,233 @@ class PDFRepairService:
         # Configure Tesseract for Linux
         self.tesseract_lang = 'chi_sim'  # Use 'chi_tra' for traditional Chinese if needed
 
-        # Check if Poppler is installed
-        self._check_poppler_installation()
+        # OCR worker pool; each worker keeps its own Tesseract API (and language model) loaded across PDFs
+        self.ocr_pool = self._create_ocr_pool()
 
-        # Initialize correction and summarization runnables
+        # Initialize correction runnable
         self.correction_runnable = self._create_correction_runnable()
-        self.summarization_runnable = self._create_summarization_runnable()
 
-        # Initialize context history (summary)
-        self.previous_summary = ""
+        # Fingerprint of the correction prompt template, so editing the prompt invalidates cached corrections
+        self.correction_prompt_version = hashlib.sha256(
+            "\x00".join(message.prompt.template for message in self.correction_runnable.first.messages).encode("utf-8")
+        ).hexdigest()
+
+        # Number of trailing characters of the previous corrected chunk passed as context to the next chunk
+        self.context_length = 300
+
+        # Text splitter shared by all uploads; the separators prefer Chinese sentence and clause boundaries
+        # over the default English-oriented fallback, which produces many more chunks for chi_sim text
+        self.chunk_size = 2000
+        self.chunk_overlap = 200
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            separators=["\n\n", "\n", "。", "，", " ", ""],
+            keep_separator="end",
+        )
+
+        # Adaptive limit on concurrent LLM requests, driven by OpenRouter's rate-limit responses
+        self.rate_limiter = AdaptiveRateLimiter()
+
+        # On-disk cache of LLM responses, so re-uploaded PDFs skip the API calls for unchanged chunks
+        # (and a crashed session resumes from the chunks it already finished)
+        self.cache = diskcache.Cache(".llm_cache")
+
+        # On-disk cache of OCR output keyed by PDF content, so re-uploading the same PDF skips OCR entirely
+        self.ocr_cache = diskcache.Cache(".ocr_cache")
 
-    def _check_poppler_installation(self) -> None:
+        # Dedicated event loop for all async work, so the shared HTTP client and rate limiter stay bound to one
+        # loop while the service is reused across Streamlit reruns and sessions
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="pdf-repair-loop", daemon=True).start()
+
+    def run(self, coroutine):
         """
-        Check if Poppler is installed and accessible in PATH.
+        Run a coroutine on the service's event loop and wait for its result. Safe to call from any thread.
 
-        Raises:
-            RuntimeError: If Poppler is not installed or not in PATH.
+        Args:
+            coroutine (Coroutine): Coroutine to run, e.g. `service.correct_pdf(path)`.
+
+        Returns:
+            Any: Result of the coroutine.
         """
-        try:
-            subprocess.run(['pdftoppm', '-v'], capture_output=True, check=True)
-            logger.info("Poppler is installed and accessible.")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            raise RuntimeError(
-                "Poppler is not installed or not in PATH. Please install poppler-utils "
-                "(e.g., `sudo apt install poppler-utils` on Ubuntu/Debian) and ensure it’s accessible."
-            )
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def _create_ocr_pool(self) -> ProcessPoolExecutor:
+        """
+        Create the OCR worker pool, with a resident Tesseract API initialized in every worker.
+
+        Returns:
+            ProcessPoolExecutor: Pool of OCR worker processes.
+        """
+        # Workers come from a forkserver, since forking the multi-threaded Streamlit process can deadlock them
+        return ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_ocr_worker,
+            initargs=(self.tesseract_lang,),
+        )
+
+    def _cache_key(self, *parts) -> str:
+        """
+        Build a cache key for an LLM response from the model name, the prompt version and the prompt inputs.
+
+        Args:
+            *parts (str): Prompt version and inputs identifying the request.
+
+        Returns:
+            str: SHA-256 hex digest of the inputs.
+        """
+        return hashlib.sha256("\x00".join((self.llm.model_name, *parts)).encode("utf-8")).hexdigest()
+
+    async def _record_rate_limit(self, response) -> None:
+        """
+        Feed rate-limit signals from OpenRouter responses into the adaptive limiter.
+
+        Args:
+            response (httpx.Response): Response received by the shared HTTP client.
+        """
+        remaining = response.headers.get("x-ratelimit-remaining")
+        if response.status_code == 429 or remaining == "0":
+            self.rate_limiter.record_rate_limited()
+        elif response.is_success:
+            self.rate_limiter.record_success()
+
+    async def _ainvoke_with_retry(self, runnable, runnable_input, max_attempts=6):
+        """
+        Invoke a runnable under the adaptive rate limiter, retrying rate-limit and transient errors with
+        jittered exponential backoff (or the server's Retry-After, when given).
+
+        Args:
+            runnable (Runnable): Runnable to invoke.
+            runnable_input (dict): Input for the runnable.
+            max_attempts (int): Maximum number of attempts before giving up.
+
+        Returns:
+            Any: Result of the runnable.
+        """
+        for attempt in range(max_attempts):
+            try:
+                async with self.rate_limiter:
+                    return await runnable.ainvoke(runnable_input)
+            except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                if attempt == max_attempts - 1:
+                    raise
+                retry_after = getattr(getattr(e, "response", None), "headers", {}).get("retry-after")
+                try:
+                    delay = min(60, float(retry_after))
+                except (TypeError, ValueError):
+                    delay = min(60, 2 ** attempt + random.random())
+                logger.warning(f"LLM request failed ({e}); retrying in {delay:.1f}s (attempt {attempt + 1}/{max_attempts}).")
+                await asyncio.sleep(delay)
+
+    async def iter_pdf_text(self, pdf_path, dpi=150):
+        """
+        Extract raw text from a PDF using Tesseract OCR, yielding each page's text in page order as soon as it is
+        recognized. All pages are submitted to the OCR pool up front, so OCR keeps running while callers process
+        earlier pages.
+
+        Args:
+            pdf_path (str): Path to the PDF file.
+            dpi (int): Resolution at which pages are rendered for OCR.
 
-    def extract_text_from_pdf(self, pdf_path) -> str:
+        Yields:
+            str: Raw OCR text for each page.
+        """
+        # Reuse the OCR output of an earlier upload of the same PDF with the same settings and OCR pipeline.
+        # Hash in a worker thread, so large uploads do not block the event loop
+        digest = await asyncio.to_thread(_file_digest, pdf_path)
+        ocr_key = f"{digest}:{self.tesseract_lang}:{dpi}:{_OCR_VERSION}:{_MAX_PAGE_HEIGHT}"
+        cached_pages = self.ocr_cache.get(ocr_key)
+        if cached_pages is not None:
+            logger.info(f"Raw text for {pdf_path} loaded from the OCR cache.")
+            for page_text in cached_pages:
+                yield page_text
+            return
+
+        with fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+
+        # Render and OCR each page in parallel in the worker processes, awaiting the results in page order
+        # Grayscale at a modest DPI keeps the pixel count (and Tesseract's work) down for clean scans
+        pages = []
+        retried = False
+        while len(pages) < page_count:
+            pool = self.ocr_pool
+            futures = []
+            try:
+                futures = [pool.submit(_ocr_page, pdf_path, page_number, dpi) for page_number in range(len(pages), page_count)]
+                for future in futures:
+                    page_text = await asyncio.wrap_future(future)
+                    logger.debug(f"Raw OCR text for page {len(pages) + 1} length: {len(page_text)}")
+                    pages.append(page_text)
+                    yield page_text
+            except BrokenProcessPool:
+                # A worker died abruptly (e.g. killed by the OOM killer) and broke the whole pool. Replace the pool,
+                # unless a concurrent extraction already has, so this and later PDFs can still be processed
+                if self.ocr_pool is pool:
+                    logger.warning("OCR worker pool is broken; starting a new one.")
+                    self.ocr_pool = self._create_ocr_pool()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                # Retry the remaining pages once; a page that keeps crashing its worker fails the extraction
+                if retried:
+                    raise
+                retried = True
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        self.ocr_cache[ocr_key] = pages
+
+        logger.info(f"Raw text extracted from {pdf_path} using OCR.")
+
+    def extract_text_from_pdf(self, pdf_path, dpi=150) -> str:
         """
         Extract raw text from a PDF using Tesseract OCR without any cleaning.
 
         Args:
             pdf_path (str): Path to the PDF file.
+            dpi (int): Resolution at which pages are rendered for OCR.
 
         Returns:
             str: Raw extracted text from the PDF.
         """
         try:
-            # Convert PDF to images with Poppler
-            images = convert_from_path(pdf_path)
-            extracted_text = ""
-
-            for i, image in enumerate(images):
-                # Perform OCR on each page
-                page_text = pytesseract.image_to_string(image, lang=self.tesseract_lang)
-                logger.debug(f"Raw OCR text for page {i + 1} length: {len(page_text)}")
-                extracted_text += page_text + "\n"
+            async def collect_pages():
+                return [page_text async for page_text in self.iter_pdf_text(pdf_path, dpi)]
 
-            logger.info(f"Raw text extracted from {pdf_path} using OCR.")
+            pages = self.run(collect_pages())
+            extracted_text = "\n".join(pages)
             return extracted_text.strip()
         
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             raise
 
+    async def iter_text_chunks(self, pages):
+        """
+        Split a stream of page texts into overlapping chunks, yielding each chunk as soon as enough text has
+        arrived that it can no longer change.
+
+        Args:
+            pages (AsyncIterable[str]): Page texts, in page order.
+
+        Yields:
+            str: Text chunks, in order.
+        """
+        buffer = ""
+        async for page_text in pages:
+            buffer = f"{buffer}\n{page_text}" if buffer else page_text
+            if len(buffer) > self.chunk_size:
+                # The last chunk may still grow with the next page, so keep it in the buffer
+                chunks = self.text_splitter.split_text(buffer)
+                for chunk in chunks[:-1]:
+                    yield chunk
+                buffer = chunks[-1] if chunks else ""
+
+        for chunk in self.text_splitter.split_text(buffer):
+            yield chunk
+
     def _create_correction_runnable(self) -> RunnableSequence:
         """
         Create a LangChain runnable for correcting OCR errors with DeepSeek.
@@ -110,7 +455,7 @@ class PDFRepairService:
         """
         correction_prompt = ChatPromptTemplate.from_template(
             "You are given a section of text from a scanned Chinese PDF, extracted using OCR, "
-            "with optional previous summary context to maintain coherence. This text may include "
+            "with optional context (the end of the previous corrected section) to maintain coherence. This text may include "
             "extraneous elements like page numbers, headers, or footers. Your task is to remove "
             "any garbled text, correct typos, fill in any missing words, restore coherence to "
             "the text, and exclude non-content elements (e.g., page numbers, headers, footers). "
@@ -122,83 +467,217 @@ class PDFRepairService:
         )
         return correction_prompt | self.llm
 
-    def _create_summarization_runnable(self) -> RunnableSequence:
+    async def correct_text_with_runnables(self, text_chunk, context="") -> str:
         """
-        Create a LangChain runnable for summarizing the history of corrected text.
-
-        Returns:
-            Runnable: Summarization runnable.
-        """
-        summarization_prompt = ChatPromptTemplate.from_template(
-            "You are given a section of corrected text from a Chinese story, previously processed "
-            "for OCR errors. Your task is to summarize this text into a concise 100-200 character "
-            "summary that captures the key narrative elements (e.g., main characters, plot points, "
-            "last sentence) for maintaining coherence in subsequent text. Please return only the "
-            "summary, without any additional explanations, notes, or commentary. Text: {text}"
-        )
-        return summarization_prompt | self.llm
-
-    def correct_text_with_runnables(self, text_chunk, context="") -> str:
-        """
-        Correct OCR errors in a text chunk using the correction runnable, with summarized context.
+        Correct OCR errors in a text chunk using the correction runnable, with context from the previous chunk.
 
         Args:
             text_chunk (str): Text chunk to correct.
-            context (str): Summarized previous context.
+            context (str): End of the previous corrected chunk.
 
         Returns:
-            str: Corrected text, with updated summary for the next chunk.
+            str: Corrected text.
         """
         try:
+            # Return the cached correction if this chunk was already corrected with the same prompt and context
+            key = self._cache_key("correction", self.correction_prompt_version, context, text_chunk)
+            if key in self.cache:
+                logger.debug("Correction cache hit.")
+                return self.cache[key]
+
             # Correct the chunk using the correction runnable
             correction_input = {"text_chunk": text_chunk, "context": context}
-            correction_result = self.correction_runnable.invoke(correction_input)
-            corrected_text = correction_result.content if hasattr(correction_result, 'content') else str(correction_result)
+            correction_result = await self._ainvoke_with_retry(self.correction_runnable, correction_input)
+            corrected_text = correction_result.content
             logger.debug(f"Corrected chunk length: {len(corrected_text)}")
-
-            # Summarize the corrected text for the next chunk's context
-            summarization_input = {"text": corrected_text}
-            summarization_result = self.summarization_runnable.invoke(summarization_input)
-            new_summary = summarization_result.content if hasattr(summarization_result, 'content') else str(summarization_result)
-            logger.debug(f"Summary length: {len(new_summary)}")
-
-            # Update context (summary) for the next chunk, ensuring it’s 100-200 characters
-            self.previous_summary = new_summary[:200] if len(new_summary) > 200 else new_summary
-            logger.info("Text chunk corrected and summarized successfully with DeepSeek runnables.")
+            self.cache[key] = corrected_text
+            logger.info("Text chunk corrected successfully with DeepSeek runnables.")
             return corrected_text
         except Exception as e:
             logger.error(f"Error correcting text with DeepSeek runnables: {e}")
             raise
 
-    def split_and_correct_text_with_runnables(self, text, chunk_size=2000, chunk_overlap=200) -> list[str]:
+    async def correct_chunks(self, chunks) -> list[str]:
+        """
+        Correct a stream of text chunks concurrently using DeepSeek, without context between chunks. Each chunk is
+        dispatched as soon as it arrives.
+
+        Args:
+            chunks (AsyncIterable[str]): Text chunks to correct.
+
+        Returns:
+            list: List of corrected text chunks, in the original order.
+        """
+        # Chunks are independent, so dispatch each one immediately; the rate limiter bounds how many are in flight
+        tasks = []
+        try:
+            async for chunk in chunks:
+                tasks.append(asyncio.create_task(self.correct_text_with_runnables(chunk)))
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        logger.info(f"Processed {len(tasks)} chunks concurrently with DeepSeek.")
+        return results
+
+    async def split_and_correct_text(self, text) -> list[str]:
+        """
+        Split text into chunks and correct all chunks concurrently using DeepSeek, without context between chunks.
+
+        Args:
+            text (str): Text to process.
+
+        Returns:
+            list: List of corrected text chunks, in the original order.
+        """
+        try:
+            chunks = self.text_splitter.split_text(text)
+
+            return await self.correct_chunks(_aiter(chunks))
+        except Exception as e:
+            logger.error(f"Error splitting and correcting text: {e}")
+            raise
+
+    def batch_api_configured(self) -> bool:
+        """
+        Check whether an API key for the batch API is set.
+
+        Returns:
+            bool: True if BATCH_API_KEY is set to a non-empty value.
+        """
+        return bool(os.getenv("BATCH_API_KEY"))
+
+    async def split_and_correct_text_batch(self, text, poll_interval=10, max_poll_interval=300) -> list[str]:
+        """
+        Split text into chunks and correct them in a single job on an OpenAI-compatible batch API, without context
+        between chunks. Batch jobs are slower but cheaper than individual requests. OpenRouter has no batch endpoint,
+        so the API is configured separately via BATCH_API_KEY, BATCH_API_BASE_URL and BATCH_MODEL.
+
+        Args:
+            text (str): Text to process.
+            poll_interval (float): Initial delay in seconds between batch status checks.
+            max_poll_interval (float): Upper bound for the exponentially growing poll delay.
+
+        Returns:
+            list: List of corrected text chunks, in the original order.
+
+        Raises:
+            RuntimeError: If the batch API is not configured, the batch job does not complete or any chunk fails.
+        """
+        try:
+            if not self.batch_api_configured():
+                raise RuntimeError("The batch API is not configured. Set BATCH_API_KEY in .env to enable it.")
+
+            chunks = self.text_splitter.split_text(text)
+            if not chunks:
+                return []
+
+            # Close the client (and its connection pool) once the batch is done
+            async with AsyncOpenAI(
+                api_key=os.getenv("BATCH_API_KEY"),
+                base_url=os.getenv("BATCH_API_BASE_URL", "https://api.openai.com/v1"),
+            ) as client:
+                model = os.getenv("BATCH_MODEL", "gpt-4o-mini")
+
+                # Write one chat completion request per chunk as JSONL
+                correction_prompt = self.correction_runnable.first
+                lines = []
+                for i, chunk in enumerate(chunks):
+                    messages = correction_prompt.format_messages(text_chunk=chunk, context="")
+                    lines.append(json.dumps({
+                        "custom_id": f"chunk-{i}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": model,
+                            "messages": [{"role": "user", "content": message.content} for message in messages],
+                            "temperature": 0,
+                        },
+                    }, ensure_ascii=False))
+                batch_file = await client.files.create(
+                    file=("corrections.jsonl", "\n".join(lines).encode("utf-8")),
+                    purpose="batch",
+                )
+                batch = await client.batches.create(
+                    input_file_id=batch_file.id,
+                    endpoint="/v1/chat/completions",
+                    completion_window="24h",
+                )
+                logger.info(f"Submitted batch {batch.id} with {len(chunks)} chunks.")
+
+                # Poll with exponential backoff until the batch finishes
+                delay = poll_interval
+                while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, max_poll_interval)
+                    batch = await client.batches.retrieve(batch.id)
+                    logger.debug(f"Batch {batch.id} status: {batch.status}")
+
+                if batch.status != "completed" or not batch.output_file_id:
+                    raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'.")
+
+                # Collect results by custom_id, since output order is not guaranteed
+                output = await client.files.content(batch.output_file_id)
+                corrected = {}
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    result = json.loads(line)
+                    response = result.get("response") or {}
+                    if response.get("status_code") != 200:
+                        raise RuntimeError(f"Batch request {result['custom_id']} failed: {result.get('error') or response}")
+                    corrected[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+                missing = [f"chunk-{i}" for i in range(len(chunks)) if f"chunk-{i}" not in corrected]
+                if missing:
+                    raise RuntimeError(f"Batch {batch.id} returned no result for {', '.join(missing)}.")
+
+                logger.info(f"Processed {len(chunks)} chunks with the batch API.")
+                return [corrected[f"chunk-{i}"] for i in range(len(chunks))]
+        except Exception as e:
+            logger.error(f"Error correcting text with the batch API: {e}")
+            raise
+
+    async def correct_chunks_with_runnables(self, chunks) -> list[str]:
+        """
+        Correct a stream of text chunks using DeepSeek runnables with context awareness, passing the end of each
+        corrected chunk as context for the next.
+
+        Args:
+            chunks (AsyncIterable[str]): Text chunks to correct, in order.
+
+        Returns:
+            list: List of corrected text chunks.
+        """
+        corrected_chunks = []
+        async for chunk in chunks:
+            # Use the tail of the previous corrected chunk as context, rather than an LLM-generated summary
+            context = corrected_chunks[-1][-self.context_length:] if corrected_chunks else ""
+            corrected_chunks.append(await self.correct_text_with_runnables(chunk, context))
+
+        logger.info(f"Processed {len(corrected_chunks)} chunks with DeepSeek using runnables and context awareness.")
+        return corrected_chunks
+
+    async def split_and_correct_text_with_runnables(self, text) -> list[str]:
         """
         Split text into chunks, correct each chunk using DeepSeek runnables with context awareness, and return corrected chunks.
 
         Args:
             text (str): Text to process.
-            chunk_size (int): Size of each chunk in characters.
-            chunk_overlap (int): Overlap between chunks in characters.
 
         Returns:
             list: List of corrected text chunks.
         """
         try:
-            # Initialize text splitter
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap
-            )
-            chunks = text_splitter.split_text(text)
-
-            # Correct each chunk with summarized context
-            corrected_chunks = []
-            for i, chunk in enumerate(chunks):
-                context = self.previous_summary if i > 0 else ""
-                corrected_chunk = self.correct_text_with_runnables(chunk, context)
-                corrected_chunks.append(corrected_chunk)
+            chunks = self.text_splitter.split_text(text)
 
-            logger.info(f"Processed {len(chunks)} chunks with DeepSeek using runnables and context awareness.")
-            return corrected_chunks
+            return await self.correct_chunks_with_runnables(_aiter(chunks))
         except Exception as e:
             logger.error(f"Error splitting and correcting text: {e}")
             raise
@@ -221,10 +700,8 @@ class PDFRepairService:
             # Optionally adjust length to match original if specified
             if original_text_length and len(final_text) != original_text_length:
                 logger.warning(f"Reassembled text length ({len(final_text)}) does not match original length ({original_text_length}). Adjusting...")
-                if len(final_text) > original_text_length:
-                    final_text = final_text[:original_text_length]
-                else:
-                    final_text += " " * (original_text_length - len(final_text))
+                # Truncate or pad with spaces in a single step
+                final_text = final_text[:original_text_length].ljust(original_text_length)
 
             logger.info("Text reassembled successfully.")
             return final_text
@@ -232,6 +709,55 @@ class PDFRepairService:
             logger.error(f"Error reassembling text: {e}")
             raise
 
+    async def correct_pdf(self, pdf_path, dpi=150, use_context=True) -> tuple[str, list[str]]:
+        """
+        Extract raw text from a PDF with OCR and correct it with DeepSeek, streaming pages from OCR into the
+        correction pipeline so that correction starts with the first chunk instead of after the last page.
+
+        Args:
+            pdf_path (str): Path to the PDF file.
+            dpi (int): Resolution at which pages are rendered for OCR.
+            use_context (bool): Correct chunks sequentially with previous-chunk context, or concurrently without it.
+
+        Returns:
+            tuple: Raw extracted text and the list of corrected text chunks.
+        """
+        try:
+            # Reuse the corrected output of an earlier upload of the same PDF with the same OCR settings, correction
+            # mode and correction prompt
+            digest = await asyncio.to_thread(_file_digest, pdf_path)
+            document_key = self._cache_key(
+                "document", self.correction_prompt_version, digest, self.tesseract_lang, str(dpi),
+                str(_OCR_VERSION), str(_MAX_PAGE_HEIGHT), str(use_context),
+            )
+            cached_result = self.cache.get(document_key)
+            if cached_result is not None:
+                logger.info(f"Corrected text for {pdf_path} loaded from the cache.")
+                extracted_text, corrected_chunks = cached_result
+                return extracted_text, corrected_chunks
+
+            pages = []
+
+            async def recorded_pages():
+                # Keep the raw pages so the full extracted text can be returned alongside the corrections
+                async for page_text in self.iter_pdf_text(pdf_path, dpi):
+                    pages.append(page_text)
+                    yield page_text
+
+            chunks = self.iter_text_chunks(recorded_pages())
+            if use_context:
+                corrected_chunks = await self.correct_chunks_with_runnables(chunks)
+            else:
+                corrected_chunks = await self.correct_chunks(chunks)
+
+            extracted_text = "\n".join(pages).strip()
+            logger.debug(f"Extracted text length: {len(extracted_text)}")
+            self.cache[document_key] = (extracted_text, corrected_chunks)
+            return extracted_text, corrected_chunks
+        except Exception as e:
+            logger.error(f"Error extracting and correcting PDF text: {e}")
+            raise
+
     def process_pdf(self, pdf_path) -> str:
         """
         Process a PDF: extract raw text with OCR, correct errors with DeepSeek runnables using context awareness, and reassemble.
@@ -243,17 +769,12 @@ class PDFRepairService:
             str: Corrected and reassembled text.
         """
         try:
-            # Extract raw text using OCR
-            extracted_text = self.extract_text_from_pdf(pdf_path)
+            # Extract raw text using OCR and correct it with runnables and context as pages arrive
+            extracted_text, corrected_chunks = self.run(self.correct_pdf(pdf_path))
             original_length = len(extracted_text)
-            logger.debug(f"Extracted text length: {original_length}")
-
-            # Reset context (summary) for a new PDF
-            self.previous_summary = ""
-
-            # Split, correct with runnables and context, and reassemble text
-            corrected_chunks = self.split_and_correct_text_with_runnables(extracted_text)
             logger.debug(f"Number of corrected chunks: {len(corrected_chunks)}")
+
+            # Reassemble text
             final_text = self.reassemble_text(corrected_chunks, original_length)
 
             logger.debug(f"Final text length: {len(final_text)}")